@@ -5,10 +5,104 @@
 #
 
 import audioop
+import struct
+
 import numpy as np
 import pyloudnorm as pyln
 import resampy
 
+# Numba compiles the WAV header fill to machine code, emitting the 44-byte
+# little-endian layout without going through CPython/struct per field. It's
+# optional; we keep a pure-Python struct implementation as the fallback.
+try:
+    from numba import njit
+
+    @njit(cache=True)
+    def _fill_wav_header(header, sample_rate, num_channels, bits_per_sample, data_size):
+        byte_rate = sample_rate * num_channels * (bits_per_sample // 8)
+        block_align = num_channels * (bits_per_sample // 8)
+        chunk_size = data_size + 36
+        # RIFF chunk descriptor
+        header[0] = 82  # R
+        header[1] = 73  # I
+        header[2] = 70  # F
+        header[3] = 70  # F
+        header[4] = chunk_size & 0xFF
+        header[5] = (chunk_size >> 8) & 0xFF
+        header[6] = (chunk_size >> 16) & 0xFF
+        header[7] = (chunk_size >> 24) & 0xFF
+        header[8] = 87  # W
+        header[9] = 65  # A
+        header[10] = 86  # V
+        header[11] = 69  # E
+        # "fmt " sub-chunk
+        header[12] = 102  # f
+        header[13] = 109  # m
+        header[14] = 116  # t
+        header[15] = 32  # ' '
+        header[16] = 16  # Subchunk1Size (16 for PCM)
+        header[17] = 0
+        header[18] = 0
+        header[19] = 0
+        header[20] = 1  # AudioFormat (1 for PCM)
+        header[21] = 0
+        header[22] = num_channels & 0xFF
+        header[23] = (num_channels >> 8) & 0xFF
+        header[24] = sample_rate & 0xFF
+        header[25] = (sample_rate >> 8) & 0xFF
+        header[26] = (sample_rate >> 16) & 0xFF
+        header[27] = (sample_rate >> 24) & 0xFF
+        header[28] = byte_rate & 0xFF
+        header[29] = (byte_rate >> 8) & 0xFF
+        header[30] = (byte_rate >> 16) & 0xFF
+        header[31] = (byte_rate >> 24) & 0xFF
+        header[32] = block_align & 0xFF
+        header[33] = (block_align >> 8) & 0xFF
+        header[34] = bits_per_sample & 0xFF
+        header[35] = (bits_per_sample >> 8) & 0xFF
+        # "data" sub-chunk
+        header[36] = 100  # d
+        header[37] = 97  # a
+        header[38] = 116  # t
+        header[39] = 97  # a
+        header[40] = data_size & 0xFF
+        header[41] = (data_size >> 8) & 0xFF
+        header[42] = (data_size >> 16) & 0xFF
+        header[43] = (data_size >> 24) & 0xFF
+
+except ImportError:
+    _fill_wav_header = None
+
+
+def create_wav_header(sample_rate, num_channels, bits_per_sample, data_size) -> bytearray:
+    if _fill_wav_header:
+        header = np.empty(44, dtype=np.uint8)
+        _fill_wav_header(header, sample_rate, num_channels, bits_per_sample, data_size)
+        return bytearray(header)
+
+    byte_rate = sample_rate * num_channels * (bits_per_sample // 8)
+    block_align = num_channels * (bits_per_sample // 8)
+    header = bytearray(44)
+    struct.pack_into(
+        "<4sI4s4sIHHIIHH4sI",
+        header,
+        0,
+        b"RIFF",
+        data_size + 36,
+        b"WAVE",
+        b"fmt ",
+        16,  # Subchunk1Size (16 for PCM)
+        1,  # AudioFormat (1 for PCM)
+        num_channels,
+        sample_rate,
+        byte_rate,
+        block_align,
+        bits_per_sample,
+        b"data",
+        data_size,
+    )
+    return header
+
 
 def resample_audio(audio: bytes, original_rate: int, target_rate: int) -> bytes:
     if original_rate == target_rate:
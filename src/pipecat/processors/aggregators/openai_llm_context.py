@@ -14,6 +14,7 @@ from typing import Any, Awaitable, Callable, List
 from loguru import logger
 from PIL import Image
 
+from pipecat.audio.utils import create_wav_header
 from pipecat.frames.frames import (
     AudioRawFrame,
     Frame,
@@ -219,27 +220,7 @@ class OpenAILLMContext:
         await f(function_name, tool_call_id, arguments, llm, self, function_call_result_callback)
 
     def create_wav_header(self, sample_rate, num_channels, bits_per_sample, data_size):
-        # RIFF chunk descriptor
-        header = bytearray()
-        header.extend(b"RIFF")  # ChunkID
-        header.extend((data_size + 36).to_bytes(4, "little"))  # ChunkSize: total size - 8
-        header.extend(b"WAVE")  # Format
-        # "fmt " sub-chunk
-        header.extend(b"fmt ")  # Subchunk1ID
-        header.extend((16).to_bytes(4, "little"))  # Subchunk1Size (16 for PCM)
-        header.extend((1).to_bytes(2, "little"))  # AudioFormat (1 for PCM)
-        header.extend(num_channels.to_bytes(2, "little"))  # NumChannels
-        header.extend(sample_rate.to_bytes(4, "little"))  # SampleRate
-        # Calculate byte rate and block align
-        byte_rate = sample_rate * num_channels * (bits_per_sample // 8)
-        block_align = num_channels * (bits_per_sample // 8)
-        header.extend(byte_rate.to_bytes(4, "little"))  # ByteRate
-        header.extend(block_align.to_bytes(2, "little"))  # BlockAlign
-        header.extend(bits_per_sample.to_bytes(2, "little"))  # BitsPerSample
-        # "data" sub-chunk
-        header.extend(b"data")  # Subchunk2ID
-        header.extend(data_size.to_bytes(4, "little"))  # Subchunk2Size
-        return header
+        return create_wav_header(sample_rate, num_channels, bits_per_sample, data_size)
 
 
 @dataclass
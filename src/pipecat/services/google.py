@@ -5,12 +5,15 @@
 #
 
 import asyncio
-import base64
+import hashlib
 import io
 import json
+import struct
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, AsyncGenerator, Dict, List, Literal, Optional
 
+import numpy as np
 from loguru import logger
 from PIL import Image
 from pydantic import BaseModel, Field
@@ -55,60 +58,118 @@ except ModuleNotFoundError as e:
     )
     raise Exception(f"Missing module: {e}")
 
+# orjson parses and serializes JSON several times faster than the stdlib,
+# which matters for large tool-call payloads; fall back to stdlib json.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# pybase64 is a SIMD-accelerated, API-compatible replacement for the stdlib
+# base64 codec; multi-KB image payloads are large enough for it to matter.
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
 
+# PyTurboJPEG (libjpeg-turbo) encodes JPEG frames several times faster than
+# PIL. It's optional; we fall back to PIL if it (or the underlying native
+# library) is not available.
+try:
+    from turbojpeg import TJPF_GRAY, TJPF_RGB, TJPF_RGBA, TurboJPEG
+
+    _TURBO_JPEG = TurboJPEG()
+    _TURBO_JPEG_PIXEL_FORMATS = {"L": (TJPF_GRAY, 1), "RGB": (TJPF_RGB, 3), "RGBA": (TJPF_RGBA, 4)}
+except Exception:
+    _TURBO_JPEG = None
+    _TURBO_JPEG_PIXEL_FORMATS = {}
+
+
+def _encode_image_to_jpeg(format: str, size: tuple[int, int], image: bytes) -> bytes:
+    if _TURBO_JPEG and format in _TURBO_JPEG_PIXEL_FORMATS:
+        pixel_format, channels = _TURBO_JPEG_PIXEL_FORMATS[format]
+        pixels = np.frombuffer(image, dtype=np.uint8).reshape(size[1], size[0], channels)
+        return _TURBO_JPEG.encode(pixels, quality=85, pixel_format=pixel_format)
+
+    buffer = io.BytesIO()
+    Image.frombytes(format, size, image).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+# Build the language map once at import time so each lookup is a single dict
+# probe instead of a dict construction per call.
+_GOOGLE_LANGUAGE_MAP = {
+    Language.BG: "bg-BG",
+    Language.CA: "ca-ES",
+    Language.ZH: "cmn-CN",
+    Language.ZH_TW: "cmn-TW",
+    Language.CS: "cs-CZ",
+    Language.DA: "da-DK",
+    Language.NL: "nl-NL",
+    Language.EN: "en-US",
+    Language.EN_US: "en-US",
+    Language.EN_AU: "en-AU",
+    Language.EN_GB: "en-GB",
+    Language.EN_IN: "en-IN",
+    Language.ET: "et-EE",
+    Language.FI: "fi-FI",
+    Language.NL_BE: "nl-BE",
+    Language.FR: "fr-FR",
+    Language.FR_CA: "fr-CA",
+    Language.DE: "de-DE",
+    Language.EL: "el-GR",
+    Language.HI: "hi-IN",
+    Language.HU: "hu-HU",
+    Language.ID: "id-ID",
+    Language.IT: "it-IT",
+    Language.JA: "ja-JP",
+    Language.KO: "ko-KR",
+    Language.LV: "lv-LV",
+    Language.LT: "lt-LT",
+    Language.MS: "ms-MY",
+    Language.NO: "nb-NO",
+    Language.PL: "pl-PL",
+    Language.PT: "pt-PT",
+    Language.PT_BR: "pt-BR",
+    Language.RO: "ro-RO",
+    Language.RU: "ru-RU",
+    Language.SK: "sk-SK",
+    Language.ES: "es-ES",
+    Language.SV: "sv-SE",
+    Language.TH: "th-TH",
+    Language.TR: "tr-TR",
+    Language.UK: "uk-UA",
+    Language.VI: "vi-VN",
+}
+
+
+@lru_cache(maxsize=64)
 def language_to_google_language(language: Language) -> str | None:
-    language_map = {
-        Language.BG: "bg-BG",
-        Language.CA: "ca-ES",
-        Language.ZH: "cmn-CN",
-        Language.ZH_TW: "cmn-TW",
-        Language.CS: "cs-CZ",
-        Language.DA: "da-DK",
-        Language.NL: "nl-NL",
-        Language.EN: "en-US",
-        Language.EN_US: "en-US",
-        Language.EN_AU: "en-AU",
-        Language.EN_GB: "en-GB",
-        Language.EN_IN: "en-IN",
-        Language.ET: "et-EE",
-        Language.FI: "fi-FI",
-        Language.NL_BE: "nl-BE",
-        Language.FR: "fr-FR",
-        Language.FR_CA: "fr-CA",
-        Language.DE: "de-DE",
-        Language.EL: "el-GR",
-        Language.HI: "hi-IN",
-        Language.HU: "hu-HU",
-        Language.ID: "id-ID",
-        Language.IT: "it-IT",
-        Language.JA: "ja-JP",
-        Language.KO: "ko-KR",
-        Language.LV: "lv-LV",
-        Language.LT: "lt-LT",
-        Language.MS: "ms-MY",
-        Language.NO: "nb-NO",
-        Language.PL: "pl-PL",
-        Language.PT: "pt-PT",
-        Language.PT_BR: "pt-BR",
-        Language.RO: "ro-RO",
-        Language.RU: "ru-RU",
-        Language.SK: "sk-SK",
-        Language.ES: "es-ES",
-        Language.SV: "sv-SE",
-        Language.TH: "th-TH",
-        Language.TR: "tr-TR",
-        Language.UK: "uk-UA",
-        Language.VI: "vi-VN",
-    }
-    return language_map.get(language)
+    return _GOOGLE_LANGUAGE_MAP.get(language)
+
+
+# proto-plus kwargs construction marshals every field through descriptor
+# lookups. For the plain text messages built on the aggregation hot path we
+# build the raw protobuf directly and wrap it, skipping that walk.
+_RAW_PART = type(glm.Part.pb(glm.Part()))
+_RAW_CONTENT = type(glm.Content.pb(glm.Content()))
+
+
+def _text_content(role: str, text: str) -> glm.Content:
+    return glm.Content.wrap(_RAW_CONTENT(role=role, parts=[_RAW_PART(text=text)]))
 
 
 class GoogleUserContextAggregator(OpenAIUserContextAggregator):
     async def _push_aggregation(self):
         if len(self._aggregation) > 0:
-            self._context.add_message(
-                glm.Content(role="user", parts=[glm.Part(text=self._aggregation)])
-            )
+            self._context.add_message(_text_content("user", self._aggregation))
 
             # Reset the aggregation. Reset it before pushing it down, otherwise
             # if the tasks gets cancelled we won't be able to clear things up.
@@ -123,20 +184,25 @@ class GoogleUserContextAggregator(OpenAIUserContextAggregator):
 
 class GoogleAssistantContextAggregator(OpenAIAssistantContextAggregator):
     async def _push_aggregation(self):
-        if not (
-            self._aggregation or self._function_call_result or self._pending_image_frame_message
-        ):
+        # Snapshot the pending state into locals once; this method runs on the
+        # hot aggregation path and the attributes were otherwise re-loaded in
+        # every branch below.
+        aggregation = self._aggregation
+        function_call_result = self._function_call_result
+        pending_image_frame_message = self._pending_image_frame_message
+
+        if not (aggregation or function_call_result or pending_image_frame_message):
             return
 
         run_llm = False
 
-        aggregation = self._aggregation
         self._reset()
+        self._function_call_result = None
+        self._pending_image_frame_message = None
 
         try:
-            if self._function_call_result:
-                frame = self._function_call_result
-                self._function_call_result = None
+            if function_call_result:
+                frame = function_call_result
                 if frame.result:
                     logger.debug(f"FunctionCallResultFrame result: {frame.arguments}")
                     self._context.add_message(
@@ -168,13 +234,10 @@ class GoogleAssistantContextAggregator(OpenAIAssistantContextAggregator):
                     )
                     run_llm = not bool(self._function_calls_in_progress)
             else:
-                self._context.add_message(
-                    glm.Content(role="model", parts=[glm.Part(text=aggregation)])
-                )
+                self._context.add_message(_text_content("model", aggregation))
 
-            if self._pending_image_frame_message:
-                frame = self._pending_image_frame_message
-                self._pending_image_frame_message = None
+            if pending_image_frame_message:
+                frame = pending_image_frame_message
                 self._context.add_image_frame_message(
                     format=frame.user_image_raw_frame.format,
                     size=frame.user_image_raw_frame.size,
@@ -216,33 +279,44 @@ class GoogleLLMContext(OpenAILLMContext):
 
     def set_messages(self, messages: List):
         self._messages[:] = messages
+        self._logging_dict_cache = {}
         self._restructure_from_openai_messages()
 
     def get_messages_for_logging(self):
+        # glm.Content messages are only ever appended to the context, so the
+        # protobuf -> dict conversion (and inline-data redaction) can be cached
+        # per message object. Contexts may be upgraded in place through
+        # upgrade_to_google(), so create the cache attribute lazily.
+        cache = getattr(self, "_logging_dict_cache", None)
+        if cache is None:
+            cache = self._logging_dict_cache = {}
+        content_to_dict = glm.Content.to_dict
         msgs = []
         for message in self.messages:
-            obj = glm.Content.to_dict(message)
-            try:
-                if "parts" in obj:
-                    for part in obj["parts"]:
-                        if "inline_data" in part:
-                            part["inline_data"]["data"] = "..."
-            except Exception as e:
-                logger.debug(f"Error: {e}")
+            obj = cache.get(id(message))
+            if obj is None:
+                obj = content_to_dict(message)
+                try:
+                    if "parts" in obj:
+                        for part in obj["parts"]:
+                            if "inline_data" in part:
+                                part["inline_data"]["data"] = "..."
+                except Exception as e:
+                    logger.debug(f"Error: {e}")
+                cache[id(message)] = obj
             msgs.append(obj)
         return msgs
 
     def add_image_frame_message(
         self, *, format: str, size: tuple[int, int], image: bytes, text: str = None
     ):
-        buffer = io.BytesIO()
-        Image.frombytes(format, size, image).save(buffer, format="JPEG")
+        jpeg_bytes = _encode_image_to_jpeg(format, size, image)
 
         parts = []
         if text:
             parts.append(glm.Part(text=text))
         parts.append(
-            glm.Part(inline_data=glm.Blob(mime_type="image/jpeg", data=buffer.getvalue())),
+            glm.Part(inline_data=glm.Blob(mime_type="image/jpeg", data=jpeg_bytes)),
         )
         self.add_message(glm.Content(role="user", parts=parts))
 
@@ -253,35 +327,71 @@ class GoogleLLMContext(OpenAILLMContext):
         sample_rate = audio_frames[0].sample_rate
         num_channels = audio_frames[0].num_channels
 
+        # Assemble the WAV blob in a single pass: preallocate one buffer, write
+        # the 44-byte header in place and copy each frame's PCM after it. This
+        # avoids the double pass of b"".join() followed by header concatenation.
+        data_size = sum(len(frame.audio) for frame in audio_frames)
+        buf = bytearray(44 + data_size)
+        byte_rate = sample_rate * num_channels * 2
+        struct.pack_into(
+            "<4sI4s4sIHHIIHH4sI",
+            buf,
+            0,
+            b"RIFF",
+            data_size + 36,
+            b"WAVE",
+            b"fmt ",
+            16,  # Subchunk1Size (16 for PCM)
+            1,  # AudioFormat (1 for PCM)
+            num_channels,
+            sample_rate,
+            byte_rate,
+            num_channels * 2,  # BlockAlign
+            16,  # BitsPerSample
+            b"data",
+            data_size,
+        )
+        mv = memoryview(buf)
+        offset = 44
+        for frame in audio_frames:
+            length = len(frame.audio)
+            mv[offset : offset + length] = frame.audio
+            offset += length
+
         parts = []
-        data = b"".join(frame.audio for frame in audio_frames)
         if text:
             parts.append(glm.Part(text=text))
         parts.append(
-            glm.Part(
-                inline_data=glm.Blob(
-                    mime_type="audio/wav",
-                    data=(
-                        bytes(
-                            self.create_wav_header(sample_rate, num_channels, 16, len(data)) + data
-                        )
-                    ),
-                )
-            ),
+            glm.Part(inline_data=glm.Blob(mime_type="audio/wav", data=bytes(buf))),
         )
         self.add_message(glm.Content(role="user", parts=parts))
-        # message = {"mime_type": "audio/mp3", "data": bytes(data + create_wav_header(sample_rate, num_channels, 16, len(data)))}
-        # self.add_message(message)
 
-    def from_standard_message(self, message):
-        role = message["role"]
-        content = message.get("content", [])
-        if role == "system":
-            self.system_message = content
-            return None
-        elif role == "assistant":
-            role = "model"
+    # from_standard_message() dispatches through the tables below; one dict
+    # lookup per message (and per content part) replaces the cascaded string
+    # comparisons that ran on every context restructure.
+
+    def _from_system_message(self, message):
+        self.system_message = message.get("content", [])
+        return None
 
+    def _from_user_message(self, message, role="user"):
+        return glm.Content(role=role, parts=self._parts_from_message(message))
+
+    def _from_assistant_message(self, message):
+        return self._from_user_message(message, role="model")
+
+    def _from_tool_message(self, message):
+        if message.get("tool_calls"):
+            return self._from_user_message(message, role="tool")
+        part = glm.Part(
+            function_response=glm.FunctionResponse(
+                name="tool_call_result",  # seems to work to hard-code the same name every time
+                response=_json_loads(message["content"]),
+            )
+        )
+        return glm.Content(role="model", parts=[part])
+
+    def _parts_from_message(self, message):
         parts = []
         if message.get("tool_calls"):
             for tc in message["tool_calls"]:
@@ -289,38 +399,53 @@ class GoogleLLMContext(OpenAILLMContext):
                     glm.Part(
                         function_call=glm.FunctionCall(
                             name=tc["function"]["name"],
-                            args=json.loads(tc["function"]["arguments"]),
+                            args=_json_loads(tc["function"]["arguments"]),
                         )
                     )
                 )
-        elif role == "tool":
-            role = "model"
-            parts.append(
-                glm.Part(
-                    function_response=glm.FunctionResponse(
-                        name="tool_call_result",  # seems to work to hard-code the same name every time
-                        response=json.loads(message["content"]),
-                    )
-                )
-            )
-        elif isinstance(content, str):
+            return parts
+
+        content = message.get("content", [])
+        if isinstance(content, str):
             parts.append(glm.Part(text=content))
         elif isinstance(content, list):
+            part_handlers = self._CONTENT_PART_HANDLERS
             for c in content:
-                if c["type"] == "text":
-                    parts.append(glm.Part(text=c["text"]))
-                elif c["type"] == "image_url":
-                    parts.append(
-                        glm.Part(
-                            inline_data=glm.Blob(
-                                mime_type="image/jpeg",
-                                data=base64.b64decode(c["image_url"]["url"].split(",")[1]),
-                            )
-                        )
-                    )
+                handler = part_handlers.get(c["type"])
+                if handler:
+                    handler(parts, c)
+        return parts
 
-        message = glm.Content(role=role, parts=parts)
-        return message
+    @staticmethod
+    def _append_text_part(parts, c):
+        parts.append(glm.Part(text=c["text"]))
+
+    @staticmethod
+    def _append_image_part(parts, c):
+        parts.append(
+            glm.Part(
+                inline_data=glm.Blob(
+                    mime_type="image/jpeg",
+                    data=base64.b64decode(c["image_url"]["url"].partition(",")[2]),
+                )
+            )
+        )
+
+    _ROLE_HANDLERS = {
+        "system": _from_system_message,
+        "assistant": _from_assistant_message,
+        "tool": _from_tool_message,
+        "user": _from_user_message,
+    }
+    _CONTENT_PART_HANDLERS = {"text": _append_text_part, "image_url": _append_image_part}
+
+    def from_standard_message(self, message):
+        role = message["role"]
+        handler = self._ROLE_HANDLERS.get(role)
+        if handler is not None:
+            return handler(self, message)
+        # Unrecognized roles keep their role string, same as before.
+        return self._from_user_message(message, role=role)
 
     def to_standard_messages(self, obj) -> list:
         msg = {"role": obj.role, "content": []}
@@ -339,25 +464,23 @@ class GoogleLLMContext(OpenAILLMContext):
                     }
                 )
             elif part.function_call:
-                args = type(part.function_call).to_dict(part.function_call).get("args", {})
+                args = glm.FunctionCall.to_dict(part.function_call).get("args", {})
                 msg["tool_calls"] = [
                     {
                         "id": part.function_call.name,
                         "type": "function",
                         "function": {
                             "name": part.function_call.name,
-                            "arguments": json.dumps(args),
+                            "arguments": _json_dumps(args),
                         },
                     }
                 ]
 
             elif part.function_response:
                 msg["role"] = "tool"
-                resp = (
-                    type(part.function_response).to_dict(part.function_response).get("response", {})
-                )
+                resp = glm.FunctionResponse.to_dict(part.function_response).get("response", {})
                 msg["tool_call_id"] = part.function_response.name
-                msg["content"] = json.dumps(resp)
+                msg["content"] = _json_dumps(resp)
 
         # there might be no content parts for tool_calls messages
         if not msg["content"]:
@@ -365,13 +488,20 @@ class GoogleLLMContext(OpenAILLMContext):
         return [msg]
 
     def _restructure_from_openai_messages(self):
+        # When a context is reused across turns the messages are usually
+        # already native glm.Content; skip the whole restructuring pass then.
+        _Content = glm.Content
+        if self._messages and all(isinstance(m, _Content) for m in self._messages):
+            return
+
         self.system_message = None
-        # first, map across self._messages calling self.from_standard_message(m) to modify messages in place
+        # Map across self._messages calling self.from_standard_message(m), dropping
+        # both None results and messages with an empty parts list in one pass.
         try:
             self._messages[:] = [
                 msg
                 for msg in (self.from_standard_message(m) for m in self._messages)
-                if msg is not None
+                if msg is not None and msg.parts
             ]
             # We might have been given a messages list with only a system message. If so, let's put that back in
             # the messages list as a user message.
@@ -381,8 +511,6 @@ class GoogleLLMContext(OpenAILLMContext):
                 )
         except Exception as e:
             logger.error(f"Error mapping messages: {e}")
-        # iterate over messages and remove any messages that have an empty content list
-        self._messages = [m for m in self._messages if m.parts]
 
 
 class GoogleLLMService(LLMService):
@@ -430,11 +558,6 @@ class GoogleLLMService(LLMService):
             self._model_name, system_instruction=self._system_instruction
         )
 
-    async def _async_generator_wrapper(self, sync_generator):
-        for item in sync_generator:
-            yield item
-            await asyncio.sleep(0)
-
     async def _process_context(self, context: OpenAILLMContext):
         await self.push_frame(LLMFullResponseStartFrame())
         try:
@@ -471,23 +594,44 @@ class GoogleLLMService(LLMService):
             completion_tokens = response.usage_metadata.candidates_token_count
             total_tokens = response.usage_metadata.total_token_count
 
-            async for chunk in self._async_generator_wrapper(response):
+            # Bind once so the streaming loop doesn't resolve the unbound
+            # method through type() on every function-call part.
+            fc_to_dict = glm.FunctionCall.to_dict
+
+            # Iterate the sync response generator directly and only yield to
+            # the event loop every few chunks; a per-chunk asyncio.sleep(0)
+            # adds a scheduler round trip for every streamed token.
+            chunk_count = 0
+            for chunk in response:
+                chunk_count += 1
+                if chunk_count & 7 == 0:
+                    await asyncio.sleep(0)
                 if chunk.usage_metadata:
                     prompt_tokens += response.usage_metadata.prompt_token_count
                     completion_tokens += response.usage_metadata.candidates_token_count
                     total_tokens += response.usage_metadata.total_token_count
                 try:
+                    # Coalesce adjacent text parts into a single TextFrame so a
+                    # chunk with many small parts pushes one frame downstream
+                    # instead of one per part.
+                    text_buf = []
                     for c in chunk.parts:
                         if c.text:
-                            await self.push_frame(TextFrame(c.text))
-                        elif c.function_call:
-                            args = type(c.function_call).to_dict(c.function_call).get("args", {})
+                            text_buf.append(c.text)
+                            continue
+                        if text_buf:
+                            await self.push_frame(TextFrame("".join(text_buf)))
+                            text_buf.clear()
+                        if c.function_call:
+                            args = fc_to_dict(c.function_call).get("args", {})
                             await self.call_function(
                                 context=context,
                                 tool_call_id="what_should_this_be",
                                 function_name=c.function_call.name,
                                 arguments=args,
                             )
+                    if text_buf:
+                        await self.push_frame(TextFrame("".join(text_buf)))
                 except Exception as e:
                     # Google LLMs seem to flag safety issues a lot!
                     if chunk.candidates[0].finish_reason == 3:
@@ -540,6 +684,11 @@ class GoogleLLMService(LLMService):
         return GoogleContextAggregatorPair(_user=user, _assistant=assistant)
 
 
+# Service-account credentials keyed by content hash (or file path); see
+# GoogleTTSService._create_client.
+_credentials_cache: Dict[str, "service_account.Credentials"] = {}
+
+
 class GoogleTTSService(TTSService):
     class InputParams(BaseModel):
         pitch: Optional[str] = None
@@ -579,6 +728,11 @@ class GoogleTTSService(TTSService):
             credentials, credentials_path
         )
 
+    def set_voice(self, voice: str):
+        super().set_voice(voice)
+        self._rebuild_ssml_template()
+        self._rebuild_voice_config()
+
     def _create_client(
         self, credentials: Optional[str], credentials_path: Optional[str]
     ) -> texttospeech_v1.TextToSpeechAsyncClient:
@@ -587,13 +741,22 @@ class GoogleTTSService(TTSService):
         # Create a Google Cloud service account for the Cloud Text-to-Speech API
         # Using either the provided credentials JSON string or the path to a service account JSON
         # file, create a Google Cloud service account and use it to authenticate with the API.
+        # Parsed credentials are memoized so that apps creating several service
+        # instances from the same service account only pay the parse once.
         if credentials:
             # Use provided credentials JSON string
-            json_account_info = json.loads(credentials)
-            creds = service_account.Credentials.from_service_account_info(json_account_info)
+            key = hashlib.blake2b(credentials.encode(), digest_size=16).hexdigest()
+            creds = _credentials_cache.get(key)
+            if creds is None:
+                json_account_info = _json_loads(credentials)
+                creds = service_account.Credentials.from_service_account_info(json_account_info)
+                _credentials_cache[key] = creds
         elif credentials_path:
             # Use service account JSON file if provided
-            creds = service_account.Credentials.from_service_account_file(credentials_path)
+            creds = _credentials_cache.get(credentials_path)
+            if creds is None:
+                creds = service_account.Credentials.from_service_account_file(credentials_path)
+                _credentials_cache[credentials_path] = creds
 
         return texttospeech_v1.TextToSpeechAsyncClient(credentials=creds)
 
@@ -603,8 +766,30 @@ class GoogleTTSService(TTSService):
     def language_to_service_language(self, language: Language) -> str | None:
         return language_to_google_language(language)
 
-    def _construct_ssml(self, text: str) -> str:
-        ssml = "<speak>"
+    async def _update_settings(self, settings: Dict[str, Any]):
+        await super()._update_settings(settings)
+        self._rebuild_ssml_template()
+        self._rebuild_voice_config()
+
+    def _rebuild_voice_config(self):
+        """Cache the voice selection and audio config protobufs plus the hot
+        settings values read per utterance. The base class updates settings
+        through the self._settings dict, so we refresh these whenever the
+        voice or settings change instead of probing the dict per TTS call."""
+        self._output_sample_rate = self._settings["sample_rate"]
+        self._voice_config = texttospeech_v1.VoiceSelectionParams(
+            language_code=self._settings["language"], name=self._voice_id
+        )
+        self._audio_config = texttospeech_v1.AudioConfig(
+            audio_encoding=texttospeech_v1.AudioEncoding.LINEAR16,
+            sample_rate_hertz=self._output_sample_rate,
+        )
+
+    def _rebuild_ssml_template(self):
+        """Precompute the SSML markup surrounding the text. The markup only
+        depends on the voice and settings, so we rebuild it when those change
+        instead of on every utterance."""
+        prefix = ["<speak>"]
 
         # Voice tag
         voice_attrs = [f"name='{self._voice_id}'"]
@@ -614,7 +799,7 @@ class GoogleTTSService(TTSService):
 
         if self._settings["gender"]:
             voice_attrs.append(f"gender='{self._settings['gender']}'")
-        ssml += f"<voice {' '.join(voice_attrs)}>"
+        prefix.append(f"<voice {' '.join(voice_attrs)}>")
 
         # Prosody tag
         prosody_attrs = []
@@ -626,28 +811,31 @@ class GoogleTTSService(TTSService):
             prosody_attrs.append(f"volume='{self._settings['volume']}'")
 
         if prosody_attrs:
-            ssml += f"<prosody {' '.join(prosody_attrs)}>"
+            prefix.append(f"<prosody {' '.join(prosody_attrs)}>")
 
         # Emphasis tag
         if self._settings["emphasis"]:
-            ssml += f"<emphasis level='{self._settings['emphasis']}'>"
+            prefix.append(f"<emphasis level='{self._settings['emphasis']}'>")
 
         # Google style tag
         if self._settings["google_style"]:
-            ssml += f"<google:style name='{self._settings['google_style']}'>"
-
-        ssml += text
+            prefix.append(f"<google:style name='{self._settings['google_style']}'>")
 
         # Close tags
+        suffix = []
         if self._settings["google_style"]:
-            ssml += "</google:style>"
+            suffix.append("</google:style>")
         if self._settings["emphasis"]:
-            ssml += "</emphasis>"
+            suffix.append("</emphasis>")
         if prosody_attrs:
-            ssml += "</prosody>"
-        ssml += "</voice></speak>"
+            suffix.append("</prosody>")
+        suffix.append("</voice></speak>")
 
-        return ssml
+        self._ssml_prefix = "".join(prefix)
+        self._ssml_suffix = "".join(suffix)
+
+    def _construct_ssml(self, text: str) -> str:
+        return f"{self._ssml_prefix}{text}{self._ssml_suffix}"
 
     async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
         logger.debug(f"Generating TTS: [{text}]")
@@ -657,35 +845,34 @@ class GoogleTTSService(TTSService):
 
             ssml = self._construct_ssml(text)
             synthesis_input = texttospeech_v1.SynthesisInput(ssml=ssml)
-            voice = texttospeech_v1.VoiceSelectionParams(
-                language_code=self._settings["language"], name=self._voice_id
-            )
-            audio_config = texttospeech_v1.AudioConfig(
-                audio_encoding=texttospeech_v1.AudioEncoding.LINEAR16,
-                sample_rate_hertz=self._settings["sample_rate"],
-            )
 
             request = texttospeech_v1.SynthesizeSpeechRequest(
-                input=synthesis_input, voice=voice, audio_config=audio_config
+                input=synthesis_input, voice=self._voice_config, audio_config=self._audio_config
             )
 
             response = await self._client.synthesize_speech(request=request)
 
             await self.start_tts_usage_metrics(text)
 
+            # The audio arrived in full with the response, so TTFB stops here
+            # rather than once per chunk inside the loop below.
+            await self.stop_ttfb_metrics()
+
             yield TTSStartedFrame()
 
-            # Skip the first 44 bytes to remove the WAV header
-            audio_content = response.audio_content[44:]
+            # Skip the first 44 bytes to remove the WAV header. Using a
+            # memoryview makes the header strip and the per-chunk slicing
+            # zero-copy; we only materialize bytes for each outgoing frame.
+            audio_mv = memoryview(response.audio_content)[44:]
 
             # Read and yield audio data in chunks
             chunk_size = 8192
-            for i in range(0, len(audio_content), chunk_size):
-                chunk = audio_content[i : i + chunk_size]
+            sample_rate = self._output_sample_rate
+            for i in range(0, len(audio_mv), chunk_size):
+                chunk = audio_mv[i : i + chunk_size]
                 if not chunk:
                     break
-                await self.stop_ttfb_metrics()
-                frame = TTSAudioRawFrame(chunk, self._settings["sample_rate"], 1)
+                frame = TTSAudioRawFrame(bytes(chunk), sample_rate, 1)
                 yield frame
                 await asyncio.sleep(0)  # Allow other tasks to run
 